@@ -27,6 +27,7 @@ Examples:
     276874.08
 """
 
+from .FinancialCalculator import _round_cents
 from .MortgageCalculator import MortgageCalculator
 from ..models import Borrower
 
@@ -72,19 +73,7 @@ class AffordabilityCalculator:
             >>> AffordabilityCalculator.max_monthly_housing_payment(borrower)
             1660.0
         """
-        AffordabilityCalculator._validate_borrower(borrower)
-
-        if not 0 < max_dti <= 1:
-            raise ValueError("DTI must be between 0 and 1.")
-
-        max_total_debt = borrower.monthly_income * max_dti
-        max_housing_payment = max_total_debt - borrower.monthly_debt
-
-        if max_housing_payment <= 0:
-            raise ValueError(
-                "Borrower cannot afford additional housing payment.")
-
-        return round(max_housing_payment, 2)
+        return _round_cents(_max_payment_raw(borrower, max_dti))
 
     @staticmethod
     def max_loan_amount(
@@ -120,26 +109,48 @@ class AffordabilityCalculator:
             >>> AffordabilityCalculator.max_loan_amount(borrower, 0.06, 30)
             276874.08
         """
-        max_payment = AffordabilityCalculator.max_monthly_housing_payment(
-            borrower, max_dti
-        )
+        # Chain the unrounded values and round only the final result
+        max_payment = _max_payment_raw(borrower, max_dti)
 
-        return MortgageCalculator.loan_amount(
-            monthly_payment=max_payment,
-            annual_interest_rate=annual_interest_rate,
-            years=years
+        return _round_cents(
+            _loan_amount_raw(max_payment, annual_interest_rate, years)
         )
 
     @staticmethod
-    def _validate_borrower(borrower: Borrower) -> None:
+    def _max_monthly_housing_payment_raw(
+        borrower: Borrower,
+        max_dti: float
+    ) -> float:
         """
-        Validate borrower inputs.
+        Validate the inputs and return the housing payment without rounding.
         """
-        if borrower.monthly_income <= 0:
+        # The DTI check needs no attribute access, so it runs first; borrower
+        # fields are then read once and reused
+        if not 0 < max_dti <= 1:
+            raise ValueError("DTI must be between 0 and 1.")
+
+        income = borrower.monthly_income
+        debt = borrower.monthly_debt
+
+        if income <= 0:
             raise ValueError("Monthly income must be greater than zero.")
-        if borrower.monthly_debt < 0:
+        if debt < 0:
             raise ValueError("Monthly debt cannot be negative.")
 
+        max_housing_payment = income * max_dti - debt
+
+        if max_housing_payment <= 0:
+            raise ValueError(
+                "Borrower cannot afford additional housing payment.")
+
+        return max_housing_payment
+
+
+# Bound once at import so the hot paths above skip repeated global and class
+# attribute lookups.
+_loan_amount_raw = MortgageCalculator._loan_amount_raw
+_max_payment_raw = AffordabilityCalculator._max_monthly_housing_payment_raw
+
 
 def max_monthly_housing_payment(
     borrower: Borrower,
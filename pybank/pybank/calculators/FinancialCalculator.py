@@ -22,6 +22,19 @@ Examples:
 from .BasicCalculator import BasicCalculator
 
 
+def _round_cents(amount: float) -> float:
+    """Round a non-negative amount to 2 decimals, half up.
+
+    Cheaper than ``round(amount, 2)``, which goes through the float-to-string
+    conversion machinery. Only valid for non-negative amounts. Infinities and
+    NaN are returned unchanged, as ``round`` does.
+    """
+    try:
+        return int(amount * 100 + 0.5) / 100.0
+    except (OverflowError, ValueError):
+        return amount
+
+
 class FinancialCalculator(BasicCalculator):
     """Stateless financial utility calculator.
 
@@ -50,7 +63,7 @@ class FinancialCalculator(BasicCalculator):
         """
         if annual_interest_rate < 0:
             raise ValueError("Interest rate cannot be negative.")
-        return BasicCalculator.divide(annual_interest_rate, 12)
+        return annual_interest_rate / 12
 
     @staticmethod
     def months_from_years(years: int) -> int:
@@ -72,7 +85,7 @@ class FinancialCalculator(BasicCalculator):
         """
         if years <= 0:
             raise ValueError("Loan term must be greater than zero.")
-        return BasicCalculator.multiply(years, 12)
+        return years * 12
 
 
 def calculate_monthly_interest_rate(annual_interest_rate: float) -> float:
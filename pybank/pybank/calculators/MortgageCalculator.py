@@ -8,6 +8,9 @@ The public API is available both as:
 - Static methods on :class:`MortgageCalculator`
 - Module-level wrapper functions for convenience
 
+Batch variants operating on NumPy arrays are available when NumPy is
+installed.
+
 Examples:
     >>> from pybank.models import Loan
     >>> from pybank.calculators.MortgageCalculator import monthly_payment, loan_amount
@@ -17,8 +20,52 @@ Examples:
     300224.91
 """
 
-from .FinancialCalculator import FinancialCalculator
-from ..models import Loan
+from functools import lru_cache
+
+from .FinancialCalculator import FinancialCalculator, _round_cents
+from . import _kernels
+from ._kernels import _TAYLOR_RATE_THRESHOLD
+from ..models import Loan, LoanBook
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+# Threads per block for the GPU batch kernel.
+_GPU_BLOCK_SIZE = 256
+
+
+@lru_cache(maxsize=4096)
+def _amortization_multiplier(annual_interest_rate: float, years: int) -> float:
+    """Return the payment-per-unit-of-principal factor for a rate and term.
+
+    The factor depends only on the rate and term, so it is memoized for
+    workloads that price many loans sharing the same terms. Inputs are expected
+    to be validated by the caller.
+    """
+    return _kernels._amortization_multiplier_kernel(annual_interest_rate, years)
+
+
+def _amortization_multiplier_batch(
+    annual_rates: "np.ndarray",
+    years: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized :func:`_amortization_multiplier` over rate and term arrays.
+
+    Inputs are expected to be validated by the caller. The computation runs in
+    the floating-point dtype of `annual_rates`.
+    """
+    months = (years * 12).astype(annual_rates.dtype)
+    monthly_rate = annual_rates / 12.0
+
+    # Both branches are evaluated; the near-zero lanes are masked afterwards
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            np.abs(monthly_rate) < _TAYLOR_RATE_THRESHOLD,
+            (1.0 + monthly_rate * (months + 1) / 2.0) / months,
+            monthly_rate / -np.expm1(-months * np.log1p(monthly_rate)),
+        )
 
 
 class MortgageCalculator(FinancialCalculator):
@@ -56,22 +103,7 @@ class MortgageCalculator(FinancialCalculator):
             ... )
             1000.0
         """
-        MortgageCalculator._validate_loan(loan)
-
-        monthly_rate = FinancialCalculator.calculate_monthly_interest_rate(
-            loan.annual_interest_rate
-        )
-        months = FinancialCalculator.months_from_years(loan.years)
-
-        # Zero-interest loan edge case
-        if monthly_rate == 0:
-            return round(loan.principal / months, 2)
-
-        numerator = monthly_rate * (1 + monthly_rate) ** months
-        denominator = (1 + monthly_rate) ** months - 1
-
-        multiplier = FinancialCalculator.divide(numerator, denominator)
-        return round(loan.principal * multiplier, 2)
+        return _round_cents(MortgageCalculator._monthly_payment_raw(loan))
 
     @staticmethod
     def loan_amount(
@@ -101,6 +133,32 @@ class MortgageCalculator(FinancialCalculator):
             >>> MortgageCalculator.loan_amount(1000, 0.0, 10)
             120000.0
         """
+        return _round_cents(
+            MortgageCalculator._loan_amount_raw(
+                monthly_payment, annual_interest_rate, years
+            )
+        )
+
+    @staticmethod
+    def _monthly_payment_raw(loan: Loan) -> float:
+        """
+        Validate the loan and return its monthly payment without rounding.
+        """
+        MortgageCalculator._validate_loan(loan)
+
+        return MortgageCalculator._monthly_payment_unchecked(
+            loan.principal, loan.annual_interest_rate, loan.years
+        )
+
+    @staticmethod
+    def _loan_amount_raw(
+        monthly_payment: float,
+        annual_interest_rate: float,
+        years: int
+    ) -> float:
+        """
+        Validate the inputs and return the implied loan amount without rounding.
+        """
         if monthly_payment <= 0:
             raise ValueError("Monthly payment must be greater than zero.")
         if annual_interest_rate < 0:
@@ -108,23 +166,298 @@ class MortgageCalculator(FinancialCalculator):
         if years <= 0:
             raise ValueError("Loan term must be greater than zero.")
 
-        monthly_rate = FinancialCalculator.calculate_monthly_interest_rate(
-            annual_interest_rate
+        return MortgageCalculator._loan_amount_unchecked(
+            monthly_payment, annual_interest_rate, years
         )
-        months = FinancialCalculator.months_from_years(years)
 
-        # Zero-interest loan edge case
-        if monthly_rate == 0:
-            return round(monthly_payment * months, 2)
+    @staticmethod
+    def _monthly_payment_unchecked(
+        principal: float,
+        annual_interest_rate: float,
+        years: int
+    ) -> float:
+        """
+        Return the unrounded monthly payment for already validated inputs.
+        """
+        return principal * _amortization_multiplier(annual_interest_rate, years)
+
+    @staticmethod
+    def _loan_amount_unchecked(
+        monthly_payment: float,
+        annual_interest_rate: float,
+        years: int
+    ) -> float:
+        """
+        Return the unrounded loan amount for already validated inputs.
+        """
+        return monthly_payment / _amortization_multiplier(annual_interest_rate, years)
+
+    @staticmethod
+    def monthly_payment_batch(
+        principals: "np.ndarray",
+        annual_rates: "np.ndarray",
+        years: "np.ndarray",
+        dtype: "str | np.dtype" = "float64"
+    ) -> "np.ndarray":
+        """Calculate fixed monthly payments for many loans at once.
+
+        Inputs are broadcast against each other. Results are returned at full
+        precision; round them when presenting.
+
+        Args:
+            principals: Loan principals.
+            annual_rates: Annual interest rates expressed as decimals.
+            years: Loan terms in years.
+            dtype: Floating-point dtype used for storage and computation.
+                `"float32"` halves memory traffic and stays within one cent of
+                `"float64"` for principals up to $1M.
+
+        Returns:
+            Array of monthly payments in `dtype`.
+
+        Raises:
+            ValueError: If any principal is not greater than zero.
+            ValueError: If any interest rate is negative.
+            ValueError: If any term is not greater than zero.
+            ValueError: If `dtype` is not a floating-point dtype.
+            ImportError: If NumPy is not installed.
+
+        Examples:
+            >>> import numpy as np
+            >>> from pybank.calculators.MortgageCalculator import MortgageCalculator
+            >>> payments = MortgageCalculator.monthly_payment_batch(
+            ...     np.array([300_000, 120_000]), np.array([0.06, 0.0]), np.array([30, 10])
+            ... )
+            >>> np.round(payments, 2).tolist()
+            [1798.65, 1000.0]
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch calculations.")
+
+        MortgageCalculator._validate_float_dtype(dtype)
+
+        principals = np.asarray(principals, dtype=dtype)
+        annual_rates = np.asarray(annual_rates, dtype=dtype)
+        years = np.asarray(years)
+
+        if not (principals > 0).all():
+            raise ValueError("Loan principal must be greater than zero.")
+        MortgageCalculator._validate_batch_terms(annual_rates, years)
+
+        return principals * _amortization_multiplier_batch(annual_rates, years)
+
+    @staticmethod
+    def loan_amount_batch(
+        monthly_payments: "np.ndarray",
+        annual_rates: "np.ndarray",
+        years: "np.ndarray",
+        dtype: "str | np.dtype" = "float64"
+    ) -> "np.ndarray":
+        """Calculate the loan principals implied by many monthly payments.
+
+        Inputs are broadcast against each other. Results are returned at full
+        precision; round them when presenting.
+
+        Args:
+            monthly_payments: Monthly payment amounts.
+            annual_rates: Annual interest rates expressed as decimals.
+            years: Loan terms in years.
+            dtype: Floating-point dtype used for storage and computation.
+
+        Returns:
+            Array of loan amounts (principals) in `dtype`.
 
-        return round(
+        Raises:
+            ValueError: If any monthly payment is not greater than zero.
+            ValueError: If any interest rate is negative.
+            ValueError: If any term is not greater than zero.
+            ValueError: If `dtype` is not a floating-point dtype.
+            ImportError: If NumPy is not installed.
+
+        Examples:
+            >>> import numpy as np
+            >>> from pybank.calculators.MortgageCalculator import MortgageCalculator
+            >>> amounts = MortgageCalculator.loan_amount_batch(
+            ...     np.array([1800, 1000]), np.array([0.06, 0.0]), np.array([30, 10])
+            ... )
+            >>> np.round(amounts, 2).tolist()
+            [300224.91, 120000.0]
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch calculations.")
+
+        MortgageCalculator._validate_float_dtype(dtype)
+
+        monthly_payments = np.asarray(monthly_payments, dtype=dtype)
+        annual_rates = np.asarray(annual_rates, dtype=dtype)
+        years = np.asarray(years)
+
+        if not (monthly_payments > 0).all():
+            raise ValueError("Monthly payment must be greater than zero.")
+        MortgageCalculator._validate_batch_terms(annual_rates, years)
+
+        return monthly_payments / _amortization_multiplier_batch(annual_rates, years)
+
+    @staticmethod
+    def monthly_payments(book: LoanBook) -> "np.ndarray":
+        """Calculate fixed monthly payments for every loan in a loan book.
+
+        Args:
+            book: Loan book holding principals, annual interest rates and terms
+                as parallel arrays.
+
+        Returns:
+            Array of monthly payments at full precision, in book order. Books
+            with floating-point principals are priced in that dtype, all
+            others in float64.
+
+        Raises:
+            ValueError: If any loan in the book fails validation.
+            ImportError: If NumPy is not installed.
+
+        Examples:
+            >>> import numpy as np
+            >>> from pybank.models import Loan, LoanBook
+            >>> from pybank.calculators.MortgageCalculator import MortgageCalculator
+            >>> book = LoanBook.from_loans([
+            ...     Loan(principal=300_000, annual_interest_rate=0.06, years=30),
+            ...     Loan(principal=120_000, annual_interest_rate=0.0, years=10),
+            ... ])
+            >>> np.round(MortgageCalculator.monthly_payments(book), 2).tolist()
+            [1798.65, 1000.0]
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch calculations.")
+
+        # Casting the rates to an integer principal dtype would truncate them
+        dtype = book.principal.dtype
+        if dtype.kind != "f":
+            dtype = np.float64
+
+        return MortgageCalculator.monthly_payment_batch(
+            book.principal,
+            book.annual_interest_rate,
+            book.years,
+            dtype=dtype,
+        )
+
+    @staticmethod
+    def monthly_payments_gpu(
+        principals: "cp.ndarray",
+        annual_rates: "cp.ndarray",
+        years: "cp.ndarray"
+    ) -> "cp.ndarray":
+        """Calculate fixed monthly payments for many loans on a CUDA GPU.
+
+        Same contract as :meth:`monthly_payment_batch`, evaluated in a single
+        fused CUDA kernel. Inputs may be host or device arrays and are
+        broadcast against each other; the result stays on the device.
+
+        Args:
+            principals: Loan principals.
+            annual_rates: Annual interest rates expressed as decimals.
+            years: Loan terms in years.
+
+        Returns:
+            CuPy array of monthly payments at full precision.
+
+        Raises:
+            ValueError: If any principal is not greater than zero.
+            ValueError: If any interest rate is negative.
+            ValueError: If any term is not greater than zero.
+            ImportError: If CuPy is not installed.
+        """
+        cp, payment_kernel = _kernels._gpu_backend()
+        if cp is None:
+            raise ImportError("CuPy is required for GPU calculations.")
+
+        principals, annual_rates, years = cp.broadcast_arrays(
+            cp.asarray(principals, dtype=cp.float64),
+            cp.asarray(annual_rates, dtype=cp.float64),
+            cp.asarray(years, dtype=cp.float64),
+        )
+
+        if not (principals > 0).all():
+            raise ValueError("Loan principal must be greater than zero.")
+        MortgageCalculator._validate_batch_terms(annual_rates, years)
+
+        out = cp.empty(principals.shape, dtype=cp.float64)
+        n = out.size
+        # CUDA rejects a launch with an empty grid
+        if n == 0:
+            return out
+
+        payment_kernel(
+            ((n + _GPU_BLOCK_SIZE - 1) // _GPU_BLOCK_SIZE,),
+            (_GPU_BLOCK_SIZE,),
             (
-                monthly_payment
-                * ((1 + monthly_rate) ** months - 1)
-                / (monthly_rate * (1 + monthly_rate) ** months)
+                cp.ascontiguousarray(principals),
+                cp.ascontiguousarray(annual_rates),
+                cp.ascontiguousarray(years),
+                out,
+                cp.int64(n),
             ),
-            2,
         )
+        return out
+
+    @staticmethod
+    def amortization_schedule(loan: Loan) -> "np.ndarray":
+        """Build the month-by-month amortization schedule of a loan.
+
+        Each row holds the payment, its interest and principal portions, and
+        the remaining balance after that payment. Powers of `(1 + r)` are
+        generated with a running product, so no `pow` call is made per row.
+
+        Args:
+            loan: Loan model containing principal, annual interest rate (decimal)
+                and term in years.
+
+        Returns:
+            Array of shape `(months, 4)` with columns payment, interest,
+            principal and balance, at full precision.
+
+        Raises:
+            ValueError: If loan principal is not greater than zero.
+            ValueError: If loan term is not greater than zero.
+            ValueError: If interest rate is negative.
+            ValueError: If the term is not a whole number of months.
+            ImportError: If NumPy is not installed.
+
+        Examples:
+            >>> from pybank.models import Loan
+            >>> from pybank.calculators.MortgageCalculator import MortgageCalculator
+            >>> schedule = MortgageCalculator.amortization_schedule(
+            ...     Loan(principal=300_000, annual_interest_rate=0.06, years=30)
+            ... )
+            >>> schedule.shape
+            (360, 4)
+            >>> schedule[0].round(2).tolist()
+            [1798.65, 1500.0, 298.65, 299701.35]
+        """
+        if np is None:
+            raise ImportError("NumPy is required for amortization schedules.")
+
+        payment = MortgageCalculator._monthly_payment_raw(loan)
+        monthly_rate = loan.annual_interest_rate / 12.0
+
+        # Fractional terms such as 2.5 years are fine as long as they come to
+        # whole months; NaN and infinite terms fail this check too
+        months = loan.years * 12
+        if months % 1:
+            raise ValueError("Loan term must be a whole number of months.")
+        months = int(months)
+
+        # powers[k] = (1 + r) ** (k + 1); annuity[k] = sum of (1 + r) ** j, j <= k
+        powers = np.cumprod(np.full(months, 1.0 + monthly_rate))
+        annuity = np.cumsum(np.concatenate(([1.0], powers[:-1])))
+
+        schedule = np.empty((months, 4))
+        schedule[:, 0] = payment
+        schedule[:, 3] = loan.principal * powers - payment * annuity
+        schedule[0, 1] = loan.principal * monthly_rate
+        schedule[1:, 1] = schedule[:-1, 3] * monthly_rate
+        schedule[:, 2] = payment - schedule[:, 1]
+        return schedule
 
     @staticmethod
     def _validate_loan(loan: Loan) -> None:
@@ -138,6 +471,27 @@ class MortgageCalculator(FinancialCalculator):
         if loan.years <= 0:
             raise ValueError("Loan term must be greater than zero.")
 
+    @staticmethod
+    def _validate_float_dtype(dtype: "str | np.dtype") -> None:
+        """
+        Validate that a batch computation dtype is floating point.
+        """
+        if np.dtype(dtype).kind != "f":
+            raise ValueError("Batch dtype must be a floating-point dtype.")
+
+    @staticmethod
+    def _validate_batch_terms(
+        annual_rates: "np.ndarray",
+        years: "np.ndarray"
+    ) -> None:
+        """
+        Validate rate and term arrays once for a whole batch.
+        """
+        if (annual_rates < 0).any():
+            raise ValueError("Interest rate cannot be negative.")
+        if not (years > 0).all():
+            raise ValueError("Loan term must be greater than zero.")
+
 
 def monthly_payment(loan: Loan) -> float:
     """Convenience wrapper for :meth:`MortgageCalculator.monthly_payment`.
@@ -178,3 +532,90 @@ def loan_amount(monthly_payment: float, annual_interest_rate: float, years: int)
         annual_interest_rate=annual_interest_rate,
         years=years,
     )
+
+
+def monthly_payment_batch(
+    principals: "np.ndarray",
+    annual_rates: "np.ndarray",
+    years: "np.ndarray",
+    dtype: "str | np.dtype" = "float64"
+) -> "np.ndarray":
+    """Convenience wrapper for :meth:`MortgageCalculator.monthly_payment_batch`.
+
+    Args:
+        principals: Loan principals.
+        annual_rates: Annual interest rates expressed as decimals.
+        years: Loan terms in years.
+        dtype: Floating-point dtype used for storage and computation.
+
+    Returns:
+        Array of monthly payments at full precision.
+    """
+    return MortgageCalculator.monthly_payment_batch(
+        principals, annual_rates, years, dtype=dtype
+    )
+
+
+def loan_amount_batch(
+    monthly_payments: "np.ndarray",
+    annual_rates: "np.ndarray",
+    years: "np.ndarray",
+    dtype: "str | np.dtype" = "float64"
+) -> "np.ndarray":
+    """Convenience wrapper for :meth:`MortgageCalculator.loan_amount_batch`.
+
+    Args:
+        monthly_payments: Monthly payment amounts.
+        annual_rates: Annual interest rates expressed as decimals.
+        years: Loan terms in years.
+        dtype: Floating-point dtype used for storage and computation.
+
+    Returns:
+        Array of loan amounts (principals) at full precision.
+    """
+    return MortgageCalculator.loan_amount_batch(
+        monthly_payments, annual_rates, years, dtype=dtype
+    )
+
+
+def monthly_payments(book: LoanBook) -> "np.ndarray":
+    """Convenience wrapper for :meth:`MortgageCalculator.monthly_payments`.
+
+    Args:
+        book: Loan book holding principals, annual interest rates and terms.
+
+    Returns:
+        Array of monthly payments at full precision, in book order.
+    """
+    return MortgageCalculator.monthly_payments(book)
+
+
+def amortization_schedule(loan: Loan) -> "np.ndarray":
+    """Convenience wrapper for :meth:`MortgageCalculator.amortization_schedule`.
+
+    Args:
+        loan: Loan model containing principal, annual interest rate, and term.
+
+    Returns:
+        Array of shape `(months, 4)` with columns payment, interest, principal
+        and balance.
+    """
+    return MortgageCalculator.amortization_schedule(loan)
+
+
+def monthly_payments_gpu(
+    principals: "cp.ndarray",
+    annual_rates: "cp.ndarray",
+    years: "cp.ndarray"
+) -> "cp.ndarray":
+    """Convenience wrapper for :meth:`MortgageCalculator.monthly_payments_gpu`.
+
+    Args:
+        principals: Loan principals.
+        annual_rates: Annual interest rates expressed as decimals.
+        years: Loan terms in years.
+
+    Returns:
+        CuPy array of monthly payments at full precision.
+    """
+    return MortgageCalculator.monthly_payments_gpu(principals, annual_rates, years)
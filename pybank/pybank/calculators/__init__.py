@@ -5,5 +5,5 @@ Subpackage for calculators
 '''
 
 from .FinancialCalculator import months_from_years, calculate_monthly_interest_rate, multiply, divide # noqa: F401
-from .MortgageCalculator import monthly_payment, loan_amount # noqa: F401
+from .MortgageCalculator import monthly_payment, loan_amount, monthly_payment_batch, loan_amount_batch, monthly_payments, monthly_payments_gpu, amortization_schedule # noqa: F401
 from .AffordabilityCalculator import max_monthly_housing_payment, max_loan_amount # noqa: F401
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""pybank.calculators._kernels
+
+Numeric kernels shared by the calculators.
+
+Kernels take plain floats and ints, perform no validation and never touch the
+domain models. The fastest available implementation is selected on first call:
+
+1. The compiled C extension :mod:`pybank.calculators._mortgage`, if built.
+2. A Numba-compiled version of the Python kernel, if Numba is installed.
+3. The pure-Python kernel.
+
+The C extension and Numba are imported only at that point, so importing
+:mod:`pybank` does not pay for them. Callers must look the kernel up on this
+module at call time rather than binding it at import, since the first call
+rebinds it.
+
+When CuPy is installed, a CUDA kernel computing whole batches of payments on
+the GPU is also provided. CuPy is likewise imported only on the first GPU call.
+"""
+
+from functools import lru_cache
+from math import expm1, log1p
+
+# Monthly rates below this use the first-order expansion of the amortization
+# multiplier instead of the closed form. The C extension reads it from here, so
+# every backend switches branch at the same rate; the CUDA kernel source is
+# built from it below.
+_TAYLOR_RATE_THRESHOLD = 1e-9
+
+
+def _amortization_multiplier_py(annual_rate: float, years: int) -> float:
+    """Return the monthly payment per unit of principal for a rate and term.
+
+    Inputs are expected to be validated by the caller.
+    """
+    months = years * 12
+    monthly_rate = annual_rate / 12.0
+
+    # Near-zero rates (including zero) make 1 - (1 + r) ** -n cancel, so use
+    # the first-order expansion of the multiplier, (1 + r*(n + 1)/2) / n
+    if abs(monthly_rate) < _TAYLOR_RATE_THRESHOLD:
+        return (1.0 + monthly_rate * (months + 1) / 2.0) / months
+
+    # 1 - (1 + r) ** -n evaluated as -expm1(-n * log1p(r)), which stays
+    # accurate when n * r is small
+    return monthly_rate / -expm1(-months * log1p(monthly_rate))
+
+
+def _select_multiplier_kernel():
+    """Return the fastest available implementation of the multiplier kernel."""
+    try:
+        from ._mortgage import amortization_multiplier_c
+    except ImportError:  # pragma: no cover - the C extension is built optionally
+        pass
+    else:
+        return amortization_multiplier_c
+
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - Numba is an optional dependency
+        return _amortization_multiplier_py
+
+    return njit(cache=True)(_amortization_multiplier_py)
+
+
+def _amortization_multiplier_kernel(annual_rate: float, years: int) -> float:
+    """Select the kernel implementation on first use, then dispatch to it."""
+    global _amortization_multiplier_kernel
+    _amortization_multiplier_kernel = _select_multiplier_kernel()
+    return _amortization_multiplier_kernel(annual_rate, years)
+
+
+# One thread per loan: three global loads, one store. Mirrors the scalar kernel,
+# including its fractional terms and near-zero threshold.
+_GPU_PAYMENT_KERNEL_SOURCE = (
+    f"#define TAYLOR_RATE_THRESHOLD {_TAYLOR_RATE_THRESHOLD!r}\n"
+) + r"""
+extern "C" __global__
+void monthly_payment_kernel(
+    const double* principal,
+    const double* annual_rate,
+    const double* years,
+    double* out,
+    const long long n)
+{
+    const long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) {
+        return;
+    }
+
+    const double months = years[i] * 12.0;
+    const double monthly_rate = annual_rate[i] / 12.0;
+
+    if (fabs(monthly_rate) < TAYLOR_RATE_THRESHOLD) {
+        out[i] = principal[i] * (1.0 + monthly_rate * (months + 1.0) / 2.0) / months;
+    } else {
+        out[i] = principal[i] * monthly_rate / -expm1(-months * log1p(monthly_rate));
+    }
+}
+"""
+
+
+@lru_cache(maxsize=1)
+def _gpu_backend():
+    """Import CuPy and build the CUDA payment kernel on first use.
+
+    Returns ``(cupy, kernel)``, or ``(None, None)`` when CuPy is not installed.
+    CuPy compiles the kernel on its first launch and caches the binary.
+    """
+    try:
+        import cupy as cp
+    except ImportError:  # pragma: no cover - CuPy is an optional dependency
+        return None, None
+
+    return cp, cp.RawKernel(_GPU_PAYMENT_KERNEL_SOURCE, "monthly_payment_kernel")
@@ -0,0 +1,37 @@
+# cython: language_level=3
+"""pybank.calculators._mortgage
+
+Optional C implementation of the amortization kernel.
+
+Build it in place with ``cythonize -i pybank/calculators/_mortgage.pyx``. When
+the compiled module is present, :mod:`pybank.calculators._kernels` prefers it
+over the Numba and pure-Python kernels.
+"""
+
+cimport cython
+from libc.math cimport expm1, fabs, log1p
+
+from ._kernels import _TAYLOR_RATE_THRESHOLD
+
+# Typed copy of the shared threshold, readable without the GIL
+cdef double _taylor_rate_threshold = _TAYLOR_RATE_THRESHOLD
+
+
+@cython.cdivision(True)
+cpdef double amortization_multiplier_c(double annual_rate, double years) noexcept nogil:
+    """Return the monthly payment per unit of principal for a rate and term.
+
+    Inputs are expected to be validated by the caller. `years` is taken as a
+    double so fractional terms match the Python kernel instead of truncating.
+    """
+    cdef double months = years * 12
+    cdef double monthly_rate = annual_rate / 12.0
+
+    # Near-zero rates (including zero) make 1 - (1 + r) ** -n cancel, so use
+    # the first-order expansion of the multiplier, (1 + r*(n + 1)/2) / n
+    if fabs(monthly_rate) < _taylor_rate_threshold:
+        return (1.0 + monthly_rate * (months + 1.0) / 2.0) / months
+
+    # 1 - (1 + r) ** -n evaluated as -expm1(-n * log1p(r)), which stays
+    # accurate when n * r is small
+    return monthly_rate / -expm1(-months * log1p(monthly_rate))
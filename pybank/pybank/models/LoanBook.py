@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+
+from .Loan import Loan
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LoanBook:
+    """
+    Portfolio of loans stored as parallel NumPy arrays, one per Loan field.
+    """
+    principal: "np.ndarray"
+    annual_interest_rate: "np.ndarray"  # decimal, e.g. 0.06 for 6%
+    years: "np.ndarray"
+
+    @classmethod
+    def from_loans(cls, loans: list[Loan], dtype: str = "float64") -> "LoanBook":
+        """
+        Build a LoanBook from a list of Loan models.
+
+        Principals, rates and terms are stored as `dtype`, so fractional terms
+        are kept; `"float32"` halves the memory footprint of large books at the
+        cost of precision.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for LoanBook.")
+
+        count = len(loans)
+        return cls(
+            principal=np.fromiter(
+                (loan.principal for loan in loans), dtype=dtype, count=count
+            ),
+            annual_interest_rate=np.fromiter(
+                (loan.annual_interest_rate for loan in loans),
+                dtype=dtype,
+                count=count,
+            ),
+            years=np.fromiter(
+                (loan.years for loan in loans), dtype=dtype, count=count
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.principal)
@@ -6,3 +6,4 @@ Subpackage for models
 
 from .Loan import Loan # noqa: F401
 from .Borrower import Borrower # noqa: F401
+from .LoanBook import LoanBook # noqa: F401
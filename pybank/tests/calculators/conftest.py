@@ -0,0 +1,44 @@
+"""Shared fixtures for the calculator tests.
+
+Canonical model instances used across several test modules are built once per
+session here and requested by name from the tests.
+
+The amortization kernel is also warmed up once before any test runs, so a
+Numba JIT compile is not charged to whichever test happens to call it first.
+"""
+
+import pytest
+
+from pybank.calculators import _kernels
+from pybank.models import Borrower, Loan
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_kernels():
+    _kernels._amortization_multiplier_kernel(0.06, 30)
+
+
+@pytest.fixture(scope="session")
+def standard_loan():
+    return Loan(
+        principal=300_000,
+        annual_interest_rate=0.06,
+        years=30
+    )
+
+
+@pytest.fixture(scope="session")
+def zero_interest_loan():
+    return Loan(
+        principal=120_000,
+        annual_interest_rate=0.0,
+        years=10
+    )
+
+
+@pytest.fixture(scope="session")
+def standard_borrower():
+    return Borrower(
+        monthly_income=6000,
+        monthly_debt=500,
+    )
@@ -20,13 +20,8 @@ from pybank.calculators.AffordabilityCalculator import AffordabilityCalculator
 from pybank.models import Borrower
 
 
-def test_max_monthly_housing_payment_standard():
-    borrower = Borrower(
-        monthly_income=6000,
-        monthly_debt=500,
-    )
-
-    max_payment = AffordabilityCalculator.max_monthly_housing_payment(borrower)
+def test_max_monthly_housing_payment_standard(standard_borrower):
+    max_payment = AffordabilityCalculator.max_monthly_housing_payment(standard_borrower)
     assert max_payment == 1660.00
 
 
@@ -63,14 +58,9 @@ def test_max_monthly_housing_payment_invalid_debt():
         AffordabilityCalculator.max_monthly_housing_payment(borrower)
 
 
-def test_max_monthly_housing_payment_invalid_dti():
-    borrower = Borrower(
-        monthly_income=6000,
-        monthly_debt=500,
-    )
-
+def test_max_monthly_housing_payment_invalid_dti(standard_borrower):
     with pytest.raises(ValueError):
-        AffordabilityCalculator.max_monthly_housing_payment(borrower, max_dti=0)
+        AffordabilityCalculator.max_monthly_housing_payment(standard_borrower, max_dti=0)
 
 
 def test_max_monthly_housing_payment_unaffordable():
@@ -83,14 +73,9 @@ def test_max_monthly_housing_payment_unaffordable():
         AffordabilityCalculator.max_monthly_housing_payment(borrower, max_dti=0.36)
 
 
-def test_max_loan_amount_standard():
-    borrower = Borrower(
-        monthly_income=6000,
-        monthly_debt=500,
-    )
-
+def test_max_loan_amount_standard(standard_borrower):
     max_loan = AffordabilityCalculator.max_loan_amount(
-        borrower,
+        standard_borrower,
         annual_interest_rate=0.06,
         years=30,
     )
@@ -98,29 +83,33 @@ def test_max_loan_amount_standard():
     assert max_loan == 276874.08
 
 
-def test_max_loan_amount_invalid_interest_rate():
-    borrower = Borrower(
-        monthly_income=6000,
-        monthly_debt=500,
+def test_max_loan_amount_uses_unrounded_housing_payment():
+    # The housing payment is 1660.0036; rounding it to 1660.00 before the loan
+    # amount conversion would give 276874.08
+    borrower = Borrower(monthly_income=6000.01, monthly_debt=500)
+
+    max_loan = AffordabilityCalculator.max_loan_amount(
+        borrower,
+        annual_interest_rate=0.06,
+        years=30,
     )
 
+    assert max_loan == 276874.68
+
+
+def test_max_loan_amount_invalid_interest_rate(standard_borrower):
     with pytest.raises(ValueError):
         AffordabilityCalculator.max_loan_amount(
-            borrower,
+            standard_borrower,
             annual_interest_rate=-0.01,
             years=30,
         )
 
 
-def test_max_loan_amount_invalid_years():
-    borrower = Borrower(
-        monthly_income=6000,
-        monthly_debt=500,
-    )
-
+def test_max_loan_amount_invalid_years(standard_borrower):
     with pytest.raises(ValueError):
         AffordabilityCalculator.max_loan_amount(
-            borrower,
+            standard_borrower,
             annual_interest_rate=0.06,
             years=0,
         )
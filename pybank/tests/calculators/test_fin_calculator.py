@@ -17,36 +17,75 @@ import pytest
 from pybank.calculators.FinancialCalculator import months_from_years, calculate_monthly_interest_rate, multiply, divide
 
 
-def test_calculate_monthly_interest_rate():
-    assert calculate_monthly_interest_rate(0.12) == 0.01
-
-
-def test_calculate_monthly_interest_rate_zero():
-    assert calculate_monthly_interest_rate(0.0) == 0.0
-
-
-def test_calculate_monthly_interest_rate_negative():
-    with pytest.raises(ValueError):
-        calculate_monthly_interest_rate(-0.05)
-
-
-def test_months_from_years():
-    assert months_from_years(30) == 360
-
-
-def test_months_from_years_invalid():
-    with pytest.raises(ValueError):
-        months_from_years(0)
-
-
-def test_multiply():
-    assert multiply(6, 7) == 42
-
-
-def test_divide():
-    assert divide(10, 2) == 5
-
-
-def test_divide_by_zero():
-    with pytest.raises(ValueError):
-        divide(10, 0)
\ No newline at end of file
+@pytest.mark.parametrize(
+    "annual_interest_rate, expected",
+    [
+        pytest.param(0.12, 0.01, id="standard"),
+        pytest.param(0.0, 0.0, id="zero"),
+    ],
+)
+def test_calculate_monthly_interest_rate(annual_interest_rate, expected):
+    assert calculate_monthly_interest_rate(annual_interest_rate) == expected
+
+
+@pytest.mark.parametrize(
+    "years, expected",
+    [
+        pytest.param(30, 360, id="whole-years"),
+        pytest.param(2.5, 30.0, id="fractional-years"),
+    ],
+)
+def test_months_from_years(years, expected):
+    assert months_from_years(years) == expected
+
+
+@pytest.mark.parametrize(
+    "x, y, expected",
+    [
+        pytest.param(6, 7, 42, id="integers"),
+        pytest.param(-3, 4, -12, id="negative-operand"),
+        pytest.param(1.5, 0.5, 0.75, id="floats"),
+    ],
+)
+def test_multiply(x, y, expected):
+    assert multiply(x, y) == expected
+
+
+@pytest.mark.parametrize(
+    "x, y, expected",
+    [
+        pytest.param(10, 2, 5, id="exact"),
+        pytest.param(7, 2, 3.5, id="non-integer-result"),
+        pytest.param(-9, 3, -3, id="negative-operand"),
+    ],
+)
+def test_divide(x, y, expected):
+    assert divide(x, y) == expected
+
+
+INVALID_INPUTS = [
+    pytest.param(
+        calculate_monthly_interest_rate,
+        (-0.05,),
+        "cannot be negative",
+        id="negative-interest-rate",
+    ),
+    pytest.param(
+        months_from_years,
+        (0,),
+        "must be greater than zero",
+        id="zero-years",
+    ),
+    pytest.param(
+        divide,
+        (10, 0),
+        "divide by zero",
+        id="divide-by-zero",
+    ),
+]
+
+
+@pytest.mark.parametrize("fn, args, match", INVALID_INPUTS)
+def test_invalid_inputs(fn, args, match):
+    with pytest.raises(ValueError, match=match):
+        fn(*args)
@@ -14,53 +14,93 @@ Examples:
     >>> # pytest -q tests/calculators/test_mortgage_calculator.py
 """
 
+import math
+import subprocess
+import sys
+from fractions import Fraction
+
 import pytest
-from pybank.models import Loan
-from pybank.calculators.MortgageCalculator import monthly_payment,loan_amount
+from pybank.calculators import _kernels
+from pybank.models import Loan, LoanBook
+from pybank.calculators.MortgageCalculator import monthly_payment,loan_amount,monthly_payment_batch,loan_amount_batch,monthly_payments,monthly_payments_gpu,amortization_schedule
 
 
-def test_monthly_payment_standard_loan():
-    loan = Loan(
-        principal=300_000,
-        annual_interest_rate=0.06,
-        years=30
-    )
-
-    payment = monthly_payment(loan)
-    assert payment == 1798.65
+@pytest.mark.parametrize(
+    "loan_fixture, expected",
+    [
+        pytest.param("standard_loan", 1798.65, id="standard"),
+        pytest.param("zero_interest_loan", 1000.00, id="zero-interest"),
+    ],
+)
+def test_monthly_payment(request, loan_fixture, expected):
+    payment = monthly_payment(request.getfixturevalue(loan_fixture))
+    assert payment == pytest.approx(expected, abs=5e-3)
 
 
-def test_monthly_payment_zero_interest():
+def test_monthly_payment_tiny_interest():
     loan = Loan(
         principal=120_000,
-        annual_interest_rate=0.0,
+        annual_interest_rate=1e-13,
         years=10
     )
 
     payment = monthly_payment(loan)
-    assert payment == 1000.00
+    assert payment == pytest.approx(1000.00, abs=5e-3)
 
 
-def test_monthly_payment_invalid_principal():
-    loan = Loan(
-        principal=0,
-        annual_interest_rate=0.05,
-        years=30
-    )
+def test_monthly_payment_rounds_half_up():
+    # 258_759 / 360 is exactly 718.775; round() would give 718.77
+    loan = Loan(principal=258_759, annual_interest_rate=0.0, years=30)
 
-    with pytest.raises(ValueError):
-        monthly_payment(loan)
+    assert monthly_payment(loan) == 718.78
 
 
-def test_monthly_payment_invalid_years():
-    loan = Loan(
-        principal=200_000,
-        annual_interest_rate=0.05,
-        years=0
-    )
+@pytest.mark.parametrize(
+    "principal, check",
+    [
+        pytest.param(float("inf"), math.isinf, id="inf"),
+        pytest.param(float("nan"), math.isnan, id="nan"),
+    ],
+)
+def test_monthly_payment_non_finite_principal(principal, check):
+    loan = Loan(principal=principal, annual_interest_rate=0.06, years=30)
+
+    assert check(monthly_payment(loan))
+
+
+def test_monthly_payment_nan_term():
+    # Every kernel backend propagates NaN rather than raising
+    loan = Loan(principal=300_000, annual_interest_rate=0.06, years=float("nan"))
+
+    assert math.isnan(monthly_payment(loan))
+
+
+def _exact_multiplier(monthly_rate, months):
+    """Closed-form amortization multiplier in exact rational arithmetic."""
+    r = Fraction(monthly_rate)
+    return r / (1 - (1 + r) ** -months)
+
+
+# Annual rates whose monthly rate lies between 1e-12 and 1e-9, where every
+# backend switches to the first-order expansion
+NEAR_ZERO_RATES = [1.2e-11, 1.2e-10, 1.2e-9, 6e-9, 1.188e-8]
+
+
+@pytest.mark.parametrize("annual_rate", NEAR_ZERO_RATES)
+def test_multiplier_near_zero_rate(annual_rate):
+    multiplier = _kernels._amortization_multiplier_kernel(annual_rate, 30)
+
+    expected = _exact_multiplier(annual_rate / 12, 360)
+    assert multiplier == pytest.approx(float(expected), rel=1e-13)
 
-    with pytest.raises(ValueError):
-        monthly_payment(loan)
+
+def test_monthly_payment_batch_near_zero_rate():
+    np = pytest.importorskip("numpy")
+
+    payments = monthly_payment_batch(1.0, np.array(NEAR_ZERO_RATES), 30)
+
+    expected = [float(_exact_multiplier(rate / 12, 360)) for rate in NEAR_ZERO_RATES]
+    assert payments.tolist() == pytest.approx(expected, rel=1e-13)
 
 
 def test_loan_amount_standard():
@@ -70,7 +110,7 @@ def test_loan_amount_standard():
         years=30
     )
 
-    assert round(computed_loan_amount, 2) == 300224.91
+    assert computed_loan_amount == pytest.approx(300224.91, abs=5e-3)
 
 
 def test_loan_amount_zero_interest():
@@ -80,31 +120,256 @@ def test_loan_amount_zero_interest():
         years=10
     )
 
-    assert computed_loan_amount == 120000
+    assert computed_loan_amount == pytest.approx(120000, abs=5e-3)
+
+
+INVALID_INPUTS = [
+    pytest.param(
+        monthly_payment,
+        {"loan": Loan(principal=0, annual_interest_rate=0.05, years=30)},
+        "principal",
+        id="monthly-payment-principal",
+    ),
+    pytest.param(
+        monthly_payment,
+        {"loan": Loan(principal=200_000, annual_interest_rate=0.05, years=0)},
+        "Loan term",
+        id="monthly-payment-years",
+    ),
+    pytest.param(
+        loan_amount,
+        {"monthly_payment": 0, "annual_interest_rate": 0.05, "years": 30},
+        "Monthly payment",
+        id="loan-amount-payment",
+    ),
+    pytest.param(
+        loan_amount,
+        {"monthly_payment": 1500, "annual_interest_rate": -0.01, "years": 30},
+        "Interest rate",
+        id="loan-amount-interest-rate",
+    ),
+    pytest.param(
+        loan_amount,
+        {"monthly_payment": 1500, "annual_interest_rate": 0.05, "years": 0},
+        "Loan term",
+        id="loan-amount-years",
+    ),
+]
+
+
+@pytest.mark.parametrize("fn, kwargs, match", INVALID_INPUTS)
+def test_invalid_inputs(fn, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        fn(**kwargs)
+
+
+def test_monthly_payment_batch_matches_scalar(standard_loan, zero_interest_loan):
+    np = pytest.importorskip("numpy")
+    loans = [
+        standard_loan,
+        zero_interest_loan,
+        Loan(principal=450_000, annual_interest_rate=0.0425, years=15),
+    ]
+
+    payments = monthly_payment_batch(
+        np.array([loan.principal for loan in loans]),
+        np.array([loan.annual_interest_rate for loan in loans]),
+        np.array([loan.years for loan in loans]),
+    )
+
+    assert payments.tolist() == pytest.approx(
+        [monthly_payment(loan) for loan in loans], abs=5e-3
+    )
+
+
+def test_monthly_payment_batch_float32_within_a_cent():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    principals = rng.uniform(10_000, 1_000_000, 10_000)
+    annual_rates = rng.uniform(0.0, 0.12, 10_000)
+    years = rng.choice([10, 15, 20, 30, 40], 10_000)
+
+    payments64 = monthly_payment_batch(principals, annual_rates, years)
+    payments32 = monthly_payment_batch(
+        principals, annual_rates, years, dtype="float32"
+    )
 
+    assert payments32.dtype == np.float32
+    assert np.abs(payments32 - payments64).max() < 0.01
+
+
+def test_loan_amount_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+
+    amounts = loan_amount_batch(
+        np.array([1800, 1000]),
+        np.array([0.06, 0.0]),
+        np.array([30, 10]),
+    )
+
+    assert amounts.tolist() == pytest.approx([
+        loan_amount(monthly_payment=1800, annual_interest_rate=0.06, years=30),
+        loan_amount(monthly_payment=1000, annual_interest_rate=0.0, years=10),
+    ], abs=5e-3)
+
+
+def test_monthly_payment_batch_invalid_principal():
+    np = pytest.importorskip("numpy")
 
-def test_loan_amount_invalid_payment():
     with pytest.raises(ValueError):
-        loan_amount(
-            monthly_payment=0,
-            annual_interest_rate=0.05,
-            years=30
+        monthly_payment_batch(
+            np.array([300_000, 0]),
+            np.array([0.06, 0.05]),
+            np.array([30, 30]),
         )
 
 
-def test_loan_amount_invalid_interest_rate():
+def test_loan_amount_batch_invalid_years():
+    np = pytest.importorskip("numpy")
+
     with pytest.raises(ValueError):
-        loan_amount(
-            monthly_payment=1500,
-            annual_interest_rate=-0.01,
-            years=30
+        loan_amount_batch(
+            np.array([1800, 1500]),
+            np.array([0.06, 0.05]),
+            np.array([30, 0]),
         )
 
 
-def test_loan_amount_invalid_years():
-    with pytest.raises(ValueError):
-        loan_amount(
-            monthly_payment=1500,
-            annual_interest_rate=0.05,
-            years=0
-        )
\ No newline at end of file
+def test_monthly_payments_loan_book(standard_loan, zero_interest_loan):
+    pytest.importorskip("numpy")
+    loans = [standard_loan, zero_interest_loan]
+
+    book = LoanBook.from_loans(loans)
+
+    assert len(book) == 2
+    assert monthly_payments(book).tolist() == pytest.approx([1798.65, 1000.00], abs=5e-3)
+
+
+def test_monthly_payments_float32_loan_book(standard_loan, zero_interest_loan):
+    np = pytest.importorskip("numpy")
+    loans = [standard_loan, zero_interest_loan]
+
+    payments = monthly_payments(LoanBook.from_loans(loans, dtype="float32"))
+
+    assert payments.dtype == np.float32
+    assert payments.tolist() == pytest.approx([1798.65, 1000.00], abs=0.01)
+
+
+def test_monthly_payments_gpu_matches_batch():
+    cp = pytest.importorskip("cupy")
+    principals = [300_000, 120_000, 450_000]
+    annual_rates = [0.06, 0.0, 0.0425]
+    years = [30, 10, 15]
+
+    payments = monthly_payments_gpu(
+        cp.asarray(principals), cp.asarray(annual_rates), cp.asarray(years)
+    )
+
+    expected = monthly_payment_batch(principals, annual_rates, years)
+    assert cp.asnumpy(payments) == pytest.approx(expected, rel=1e-12)
+
+
+def test_monthly_payments_gpu_empty_input():
+    cp = pytest.importorskip("cupy")
+
+    payments = monthly_payments_gpu(cp.empty(0), cp.empty(0), cp.empty(0))
+
+    assert payments.shape == (0,)
+
+
+def test_monthly_payments_gpu_without_cupy():
+    try:
+        import cupy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("CuPy is installed")
+
+    with pytest.raises(ImportError, match="CuPy"):
+        monthly_payments_gpu([300_000], [0.06], [30])
+
+
+def test_import_does_not_load_optional_backends():
+    # Numba and CuPy are imported on first use only, never by importing pybank
+    code = (
+        "import sys, pybank.calculators; "
+        "print(sorted({'numba', 'cupy'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_amortization_schedule_pays_off_loan(standard_loan):
+    np = pytest.importorskip("numpy")
+
+    schedule = amortization_schedule(standard_loan)
+
+    assert schedule.shape == (360, 4)
+    assert schedule[0, 1] == pytest.approx(1500.00)
+    assert schedule[:, 2].sum() == pytest.approx(300_000)
+    assert schedule[-1, 3] == pytest.approx(0.0, abs=1e-6)
+    assert np.allclose(schedule[:, 1] + schedule[:, 2], schedule[:, 0])
+
+
+def test_amortization_schedule_zero_interest(zero_interest_loan):
+    pytest.importorskip("numpy")
+
+    schedule = amortization_schedule(zero_interest_loan)
+
+    assert (schedule[:, 1] == 0).all()
+    assert schedule[59, 3] == pytest.approx(60_000)
+    assert schedule[-1, 3] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_monthly_payments_fractional_term_loan_book():
+    pytest.importorskip("numpy")
+    loan = Loan(principal=100_000, annual_interest_rate=0.06, years=2.5)
+
+    payments = monthly_payments(LoanBook.from_loans([loan]))
+
+    assert payments.tolist() == pytest.approx([monthly_payment(loan)], abs=5e-3)
+
+
+def test_monthly_payments_integer_loan_book():
+    np = pytest.importorskip("numpy")
+    book = LoanBook(
+        principal=np.array([300_000, 120_000]),
+        annual_interest_rate=np.array([0.06, 0.0]),
+        years=np.array([30, 10]),
+    )
+
+    payments = monthly_payments(book)
+
+    assert payments.dtype == np.float64
+    assert payments.tolist() == pytest.approx([1798.65, 1000.00], abs=5e-3)
+
+
+def test_monthly_payment_batch_rejects_integer_dtype():
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="floating-point"):
+        monthly_payment_batch(
+            np.array([300_000]), np.array([0.06]), np.array([30]), dtype="int64"
+        )
+
+
+def test_amortization_schedule_fractional_term():
+    pytest.importorskip("numpy")
+    loan = Loan(principal=100_000, annual_interest_rate=0.06, years=2.5)
+
+    schedule = amortization_schedule(loan)
+
+    assert schedule.shape == (30, 4)
+    assert schedule[0, 0] == pytest.approx(monthly_payment(loan), abs=5e-3)
+    assert schedule[-1, 3] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_amortization_schedule_partial_month_term():
+    pytest.importorskip("numpy")
+    loan = Loan(principal=100_000, annual_interest_rate=0.06, years=2.51)
+
+    with pytest.raises(ValueError, match="whole number of months"):
+        amortization_schedule(loan)
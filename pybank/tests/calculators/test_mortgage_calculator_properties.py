@@ -0,0 +1,64 @@
+"""Property-based tests for the mortgage calculator.
+
+These tests draw random loans with Hypothesis and compare the calculator
+against an independent oracle: the textbook closed form
+
+    pmt = pv * r * (1 + r)**n / ((1 + r)**n - 1)
+
+evaluated directly, as done by numpy-financial's `pmt`. The calculator uses a
+different, cancellation-free formulation, so agreement to the cent guards the
+kernels against regressions across the whole input space.
+
+The module is skipped when Hypothesis is not installed.
+
+Examples:
+    Run this test module directly with pytest:
+
+    >>> # pytest -q tests/calculators/test_mortgage_calculator_properties.py
+"""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, strategies as st  # noqa: E402
+
+from pybank.models import Loan  # noqa: E402
+from pybank.calculators.MortgageCalculator import monthly_payment, monthly_payment_batch  # noqa: E402
+
+# Rates are either exactly zero or large enough for the oracle's (1 + r)**n - 1
+# to keep its precision; the calculator's near-zero path is covered elsewhere.
+principals = st.floats(min_value=1e3, max_value=1e7)
+annual_rates = st.one_of(st.just(0.0), st.floats(min_value=1e-4, max_value=0.2))
+terms = st.integers(min_value=1, max_value=40)
+
+
+def pmt_oracle(principal, annual_interest_rate, years):
+    rate = annual_interest_rate / 12
+    nper = years * 12
+    if rate == 0:
+        return principal / nper
+    c = (1 + rate) ** nper
+    return principal * c * rate / (c - 1)
+
+
+@given(principals, annual_rates, terms)
+def test_monthly_payment_matches_closed_form(principal, annual_interest_rate, years):
+    loan = Loan(
+        principal=principal,
+        annual_interest_rate=annual_interest_rate,
+        years=years
+    )
+
+    expected = pmt_oracle(principal, annual_interest_rate, years)
+    assert monthly_payment(loan) == pytest.approx(expected, abs=5e-3 + 1e-6)
+
+
+@given(st.lists(st.tuples(principals, annual_rates, terms), min_size=1, max_size=50))
+def test_monthly_payment_batch_matches_closed_form(loans):
+    np = pytest.importorskip("numpy")
+    principal, annual_interest_rate, years = (np.array(column) for column in zip(*loans))
+
+    expected = [pmt_oracle(*loan) for loan in loans]
+    payments = monthly_payment_batch(principal, annual_interest_rate, years)
+    assert payments.tolist() == pytest.approx(expected, rel=1e-9)